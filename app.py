@@ -1,6 +1,9 @@
 import io
+import os
 import calendar
-from datetime import date, datetime, timedelta
+import multiprocessing
+import tempfile
+from datetime import date, datetime
 
 import pandas as pd
 import streamlit as st
@@ -8,6 +11,11 @@ from dateutil.relativedelta import relativedelta
 from openpyxl import Workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 
+from hr_cost.calendar import DayCounts
+from hr_cost.export import export_roster_zip
+from hr_cost.models import EmployeeRoster, EmployerInsurance, Holiday
+from hr_cost.sensitivity import DateSensitivity
+
 def check_password():
     if "password_correct" not in st.session_state:
         st.text_input("Nhap mat khau de xam nhap he thong", type="password", on_change=password_entered, key="password")
@@ -37,29 +45,6 @@ def to_date(x) -> date:
         return x.date()
     return pd.to_datetime(x, dayfirst=True).date()
 
-def is_workday_mon_sat(d: date) -> bool:
-    return d.weekday() <= 5
-
-def daterange(d1: date, d2: date):
-    cur = d1
-    while cur <= d2:
-        yield cur
-        cur += timedelta(days=1)
-
-def count_workdays_mon_sat(start: date, end: date, holidays_set: set[date]) -> int:
-    cnt = 0
-    for d in daterange(start, end):
-        if is_workday_mon_sat(d) and (d not in holidays_set):
-            cnt += 1
-    return cnt
-
-def count_holidays_monsat(start: date, end: date, holidays_set: set[date]) -> int:
-    cnt = 0
-    for d in daterange(start, end):
-        if d in holidays_set and is_workday_mon_sat(d):
-            cnt += 1
-    return cnt
-
 def month_start_end(year: int, month: int) -> tuple[date, date]:
     ms = date(year, month, 1)
     me = date(year, month, calendar.monthrange(year, month)[1])
@@ -99,6 +84,36 @@ def parse_holidays_upload(upload) -> pd.DataFrame:
     df = df[["date", "name"]].reset_index(drop=True)
     return df
 
+# ----------------------------
+# Process-wide shared resources (all sessions read the same immutable objects)
+# ----------------------------
+@st.cache_resource(max_entries=32, show_spinner=False)
+def cached_holiday_rows(file_name: str, data: bytes) -> tuple:
+    buf = io.BytesIO(data)
+    buf.name = file_name
+    df = parse_holidays_upload(buf)
+    return tuple(zip(df["date"], df["name"]))
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def year_day_counts(year: int, holiday_ordinals: tuple) -> DayCounts:
+    """
+    Per-day Mon-Sat workday / holiday prefix counts for one year and holiday set.
+    Read-only once built; every session (and the sensitivity curve) shares it.
+    """
+    holidays = [Holiday(date=date.fromordinal(o)) for o in holiday_ordinals]
+    return DayCounts(date(year, 1, 1), date(year, 12, 31), holidays)
+
+def holidays_from_df(holidays_df: pd.DataFrame) -> list[Holiday]:
+    return [
+        Holiday(date=to_date(d), name="" if pd.isna(n) else str(n))
+        for d, n in zip(holidays_df["date"], holidays_df["name"])
+        if to_date(d) is not None
+    ]
+
+def holiday_key(holidays_df: pd.DataFrame) -> tuple:
+    dates = (to_date(d) for d in holidays_df["date"].dropna().tolist())
+    return tuple(sorted({d.toordinal() for d in dates if d is not None}))
+
 def default_holidays_for_year(year: int) -> pd.DataFrame:
     samples = [
         (date(year, 1, 1), "Tet Duong lich"),
@@ -119,7 +134,7 @@ def calculate_monthly_cost(
     employer_ins_rate: float,
     employer_ins_cap: float,
 ) -> pd.DataFrame:
-    holidays_set = set(holidays_df["date"].dropna().tolist())
+    days = year_day_counts(year, holiday_key(holidays_df))
     monthly_leave_accrual = annual_leave_days / 12.0
     rows = []
 
@@ -128,8 +143,8 @@ def calculate_monthly_cost(
         calc_start = max(start_date, ms)
         calc_end = min(end_date, me)
 
-        standard_workdays = count_workdays_mon_sat(ms, me, holidays_set)  
-        month_holidays = count_holidays_monsat(ms, me, holidays_set)      
+        standard_workdays = days.count_workdays(ms.toordinal(), me.toordinal())
+        month_holidays = days.count_paid_holidays(ms.toordinal(), me.toordinal())
         standard_paid_days = standard_workdays + month_holidays           
 
         if calc_start > calc_end:
@@ -137,8 +152,8 @@ def calculate_monthly_cost(
             paid_workdays = 0
             paid_holidays = 0
         else:
-            paid_workdays = count_workdays_mon_sat(calc_start, calc_end, holidays_set)
-            paid_holidays = count_holidays_monsat(calc_start, calc_end, holidays_set)
+            paid_workdays = days.count_workdays(calc_start.toordinal(), calc_end.toordinal())
+            paid_holidays = days.count_paid_holidays(calc_start.toordinal(), calc_end.toordinal())
             actual_paid_days = paid_workdays + paid_holidays              
 
         if standard_workdays <= 0:
@@ -232,7 +247,10 @@ with st.sidebar:
     use_default = st.checkbox("Dung danh sach mau", value=True)
 
 try:
-    holidays_df = parse_holidays_upload(upload)
+    if upload is not None:
+        holidays_df = pd.DataFrame(list(cached_holiday_rows(upload.name, upload.getvalue())), columns=["date", "name"])
+    else:
+        holidays_df = pd.DataFrame(columns=["date", "name"])
 except Exception as e:
     st.error(f"Loi: {e}")
     holidays_df = pd.DataFrame(columns=["date", "name"])
@@ -285,6 +303,20 @@ k1.metric("Tong luong phai tra", f"{total_salary:,.0f} VND")
 k2.metric("Tong Bao Hiem", f"{total_ins:,.0f} VND")
 k3.metric("Tong chi phi cong ty", f"{total_company:,.0f} VND")
 
+st.subheader("Chi phi nam theo ngay bat dau")
+curve = DateSensitivity(
+    float(gross),
+    int(year),
+    holidays_from_df(edited_holidays),
+    annual_leave_days=float(annual_leave_days),
+    employer_insurance=EmployerInsurance(
+        enabled=bool(employer_ins_enabled), rate=float(employer_ins_rate), cap=float(employer_ins_cap)
+    ),
+    days=year_day_counts(int(year), holiday_key(edited_holidays)),
+).by_start_date(end_date=end_dt)
+curve_df = pd.DataFrame(curve).rename(columns={"date": "Ngay bat dau", "Q": "TONG CHI PHI CÔNG TY"})
+st.line_chart(curve_df, x="Ngay bat dau", y="TONG CHI PHI CÔNG TY")
+
 inputs = {
     "gross": gross,
     "start_date": start_dt.strftime("%d/%m/%Y"),
@@ -303,3 +335,46 @@ st.download_button(
     file_name=f"Chi_phi_nhan_su_{year}.xlsx",
     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
 )
+
+st.divider()
+st.subheader("Xuat hang loat theo nhan vien")
+roster_upload = st.file_uploader(
+    "Tai danh sach nhan vien (employee_id, gross_monthly, start_date, end_date, ...)",
+    type=["csv", "xlsx", "xls"],
+    key="roster_upload",
+)
+if roster_upload is not None and st.button("Tao file ZIP"):
+    try:
+        if roster_upload.name.lower().endswith(".csv"):
+            roster_df = pd.read_csv(roster_upload)
+        else:
+            roster_df = pd.read_excel(roster_upload)
+        roster = EmployeeRoster.from_dataframe(roster_df)
+    except Exception as e:
+        st.error(f"Loi: {e}")
+    else:
+        holidays = holidays_from_df(edited_holidays)
+        bar = st.progress(0.0)
+
+        def report(done: int, total: int):
+            bar.progress(done / total, text=f"{done}/{total}")
+
+        # Build the archive on disk (workbooks are written as they finish);
+        # st.download_button still loads the finished ZIP into server memory.
+        # spawn: do not fork the multi-threaded Streamlit server process.
+        fd, zip_path = tempfile.mkstemp(suffix=".zip")
+        os.close(fd)
+        try:
+            export_roster_zip(
+                roster, holidays, int(year), zip_path,
+                progress=report, mp_context=multiprocessing.get_context("spawn"),
+            )
+            with open(zip_path, "rb") as zip_file:
+                st.download_button(
+                    "Tai xuong ZIP",
+                    data=zip_file,
+                    file_name=f"Chi_phi_nhan_vien_{year}.zip",
+                    mime="application/zip",
+                )
+        finally:
+            os.remove(zip_path)
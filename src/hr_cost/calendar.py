@@ -1,6 +1,9 @@
+import csv
+from array import array
+from bisect import bisect_left, bisect_right
 from datetime import date, timedelta
-from typing import List
-from .models import Holiday
+from typing import List, Sequence
+from .models import Holiday, to_ordinal
 
 
 def daterange(start: date, end: date):
@@ -47,4 +50,96 @@ def count_paid_holidays(start: date, end: date, holidays: List[Holiday]) -> int:
         if d in holiday_set and is_workday_mon_sat(d):
             count += 1
 
-    return count
\ No newline at end of file
+    return count
+
+# ----------------------------
+# Ordinal helpers (closed form, no day-by-day loop)
+# date.toordinal() % 7 == 0  <=>  Sunday
+# ----------------------------
+def count_mon_sat_days(start_ordinal: int, end_ordinal: int) -> int:
+    """
+    Count Mon–Sat days in [start_ordinal, end_ordinal] (date ordinals, inclusive).
+    """
+    if start_ordinal > end_ordinal:
+        return 0
+    sundays = end_ordinal // 7 - (start_ordinal - 1) // 7
+    return end_ordinal - start_ordinal + 1 - sundays
+
+
+def paid_holiday_ordinals(holidays: List[Holiday]) -> List[int]:
+    """
+    Sorted, de-duplicated ordinals of holidays that fall on Mon–Sat.
+    """
+    return sorted({h.date.toordinal() for h in holidays if is_workday_mon_sat(h.date)})
+
+
+def count_ordinals_between(ordinals: Sequence[int], start_ordinal: int, end_ordinal: int) -> int:
+    """
+    Count entries of a sorted ordinal list inside [start_ordinal, end_ordinal].
+    """
+    if start_ordinal > end_ordinal:
+        return 0
+    return bisect_right(ordinals, end_ordinal) - bisect_left(ordinals, start_ordinal)
+
+
+class DayCounts:
+    """
+    Cumulative per-day counts over [start, end]:
+      workdays[k]      = Mon–Sat non-holidays in the first k days
+      paid_holidays[k] = Mon–Sat holidays in the first k days
+    Any sub-range count is then a difference of two entries (O(1)).
+    """
+
+    def __init__(self, start: date, end: date, holidays: List[Holiday]):
+        self.first_ordinal = start.toordinal()
+        self.last_ordinal = end.toordinal()
+        holiday_set = set(paid_holiday_ordinals(holidays))
+
+        self.workdays = array("i", [0])
+        self.paid_holidays = array("i", [0])
+        w = p = 0
+        for o in range(self.first_ordinal, self.last_ordinal + 1):
+            if o % 7 != 0:  # not Sunday
+                if o in holiday_set:
+                    p += 1
+                else:
+                    w += 1
+            self.workdays.append(w)
+            self.paid_holidays.append(p)
+
+    def count_workdays(self, start_ordinal: int, end_ordinal: int) -> int:
+        start_ordinal = max(start_ordinal, self.first_ordinal)
+        end_ordinal = min(end_ordinal, self.last_ordinal)
+        if start_ordinal > end_ordinal:
+            return 0
+        return self.workdays[end_ordinal - self.first_ordinal + 1] - self.workdays[start_ordinal - self.first_ordinal]
+
+    def count_paid_holidays(self, start_ordinal: int, end_ordinal: int) -> int:
+        start_ordinal = max(start_ordinal, self.first_ordinal)
+        end_ordinal = min(end_ordinal, self.last_ordinal)
+        if start_ordinal > end_ordinal:
+            return 0
+        return (
+            self.paid_holidays[end_ordinal - self.first_ordinal + 1]
+            - self.paid_holidays[start_ordinal - self.first_ordinal]
+        )
+
+
+def load_holidays_csv(path: str) -> List[Holiday]:
+    """
+    First column = date (YYYY-MM-DD or DD/MM/YYYY), optional second column = name.
+    A header row is skipped if its first cell is not a date.
+    """
+    holidays: List[Holiday] = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for n, row in enumerate(csv.reader(f)):
+            if not row or not row[0].strip():
+                continue
+            try:
+                d = date.fromordinal(to_ordinal(row[0]))
+            except ValueError:
+                if n == 0:
+                    continue
+                raise
+            holidays.append(Holiday(date=d, name=row[1] if len(row) > 1 else ""))
+    return holidays
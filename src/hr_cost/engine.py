@@ -1,9 +1,98 @@
 import calendar as pycal
+from array import array
 from datetime import date
-from typing import Any, Dict, List
+from typing import Any, Dict, List, NamedTuple
+
+from .calendar import (
+    count_mon_sat_days,
+    count_ordinals_between,
+    count_paid_holidays,
+    count_workdays_mon_sat,
+    paid_holiday_ordinals,
+)
+from .models import EmployeeRoster, EmployerInsurance, Holiday, Inputs
+
+
+class MonthFigures(NamedTuple):
+    I: int
+    leave_monthly_accrual: float
+    leave_ratio: float
+    J: float
+    K: float
+    L: float
+    M: float
+    N: float
+    O: float
+    P: float
+    Q: float
+
+
+# ----------------------------
+# Spec sections 4-7 for one month once the day counts are known.
+# Single implementation: CalculationEngine and the roster / sensitivity /
+# forecast / solver modules all go through month_figures.
+# ----------------------------
+def leave_days(F: int, I: int, paid_workdays: int, annual_leave_days: float) -> tuple[float, float, float]:
+    """
+    Spec section 4 -> (monthly_accrual, ratio, J).
+    ratio = I / F (clamped 0..1), if F==0 => ratio=0
+    """
+    monthly_accrual = float(annual_leave_days) / 12.0
+
+    if F <= 0:
+        ratio = 0.0
+    else:
+        ratio = max(0.0, min(1.0, I / float(F)))
+
+    J = monthly_accrual * ratio
+
+    # Guard: do not let leave exceed paid_workdays (prevents negative L in edge cases)
+    return monthly_accrual, ratio, min(J, float(paid_workdays))
+
+
+def employer_insurance_cost(O: float, employer_insurance: EmployerInsurance) -> float:
+    """
+    Spec section 6: base = min(O, cap) if cap>0 else O; P = base * rate if enabled else 0
+    """
+    if not employer_insurance.enabled:
+        return 0.0
+
+    base = float(O)
+    if employer_insurance.cap and employer_insurance.cap > 0:
+        base = min(base, float(employer_insurance.cap))
+
+    return base * float(employer_insurance.rate)
+
+
+def total_company_cost(O: float, P: float, M: float, N: float) -> float:
+    """
+    Spec section 7 (Excel behavior): Q = O + P + M + N
+    """
+    return float(O) + float(P) + float(M) + float(N)
+
 
-from .calendar import count_paid_holidays, count_workdays_mon_sat
-from .models import Holiday, Inputs
+def month_figures(
+    F: int,
+    H: int,
+    paid_workdays: int,
+    paid_holidays: int,
+    gross_monthly: float,
+    annual_leave_days: float,
+    employer_insurance: EmployerInsurance,
+) -> MonthFigures:
+    I = paid_workdays + paid_holidays
+    monthly_accrual, ratio, J = leave_days(F, I, paid_workdays, annual_leave_days)
+
+    # Spec section 5
+    K = (float(gross_monthly) / float(H)) if H > 0 else 0.0
+    L = (float(paid_workdays) - float(J)) * K
+    M = float(J) * K
+    N = float(paid_holidays) * K
+    O = float(I) * K
+
+    P = employer_insurance_cost(O, employer_insurance)
+    Q = total_company_cost(O, P, M, N)
+    return MonthFigures(I, monthly_accrual, ratio, J, K, L, M, N, O, P, Q)
 
 
 class CalculationEngine:
@@ -46,10 +135,6 @@ class CalculationEngine:
         month_end = date(year, month, pycal.monthrange(year, month)[1])
         return month_start, month_end
 
-    @staticmethod
-    def _clamp(x: float, lo: float, hi: float) -> float:
-        return max(lo, min(hi, x))
-
     # ----------------------------
     # Spec section 2: Standard month counts (F,G,H)
     # ----------------------------
@@ -106,26 +191,14 @@ class CalculationEngine:
         std = self._calculate_standard_month_counts(year, month)
         actual = self._calculate_actual_paid_days(year, month)
 
-        F = std["F"]
-        I = actual["I"]
-
-        monthly_accrual = float(self.inputs.annual_leave_days) / 12.0
-
-        if F <= 0:
-            ratio = 0.0
-        else:
-            ratio = self._clamp(I / float(F), 0.0, 1.0)
-
-        J = monthly_accrual * ratio
-
-        # Guard: do not let leave exceed paid_workdays (prevents negative L in edge cases)
-        paid_workdays = actual["paid_workdays"]
-        J_capped = min(J, float(paid_workdays))
+        monthly_accrual, ratio, J = leave_days(
+            std["F"], actual["I"], actual["paid_workdays"], self.inputs.annual_leave_days
+        )
 
         return {
             "monthly_accrual": monthly_accrual,
             "ratio": ratio,
-            "J": J_capped,
+            "J": J,
         }
 
     # ----------------------------
@@ -139,32 +212,19 @@ class CalculationEngine:
     def _calculate_salary_breakdown(self, year: int, month: int) -> Dict[str, Any]:
         std = self._calculate_standard_month_counts(year, month)
         actual = self._calculate_actual_paid_days(year, month)
-        leave = self._calculate_leave_days(year, month)
-
-        H = std["H"]
-        I = actual["I"]
-        paid_workdays = actual["paid_workdays"]
-        paid_holidays = actual["paid_holidays"]
-        J = leave["J"]
-
-        K = (float(self.inputs.gross_monthly) / float(H)) if H > 0 else 0.0
-
-        L = (float(paid_workdays) - float(J)) * K
-        M = float(J) * K
-        N = float(paid_holidays) * K
-        O = float(I) * K
+        fig = self._calculate_month_figures(std, actual)
 
         return {
-            "K": K,
-            "L": L,
-            "M": M,
-            "N": N,
-            "O": O,
-            "H": H,
-            "I": I,
-            "paid_workdays": paid_workdays,
-            "paid_holidays": paid_holidays,
-            "J": J,
+            "K": fig.K,
+            "L": fig.L,
+            "M": fig.M,
+            "N": fig.N,
+            "O": fig.O,
+            "H": std["H"],
+            "I": fig.I,
+            "paid_workdays": actual["paid_workdays"],
+            "paid_holidays": actual["paid_holidays"],
+            "J": fig.J,
         }
 
     # ----------------------------
@@ -173,22 +233,28 @@ class CalculationEngine:
     # P = base * rate if enabled else 0
     # ----------------------------
     def _calculate_employer_insurance(self, O: float) -> float:
-        ins = self.inputs.employer_insurance
-        if not ins.enabled:
-            return 0.0
-
-        base = float(O)
-        if ins.cap and ins.cap > 0:
-            base = min(base, float(ins.cap))
-
-        return base * float(ins.rate)
+        return employer_insurance_cost(O, self.inputs.employer_insurance)
 
     # ----------------------------
     # Spec section 7: IMPORTANT Excel total (Q)
     # Q = O + P + M + N   (Excel behavior)
     # ----------------------------
     def _calculate_total_company_cost(self, O: float, P: float, M: float, N: float) -> float:
-        return float(O) + float(P) + float(M) + float(N)
+        return total_company_cost(O, P, M, N)
+
+    # ----------------------------
+    # Spec sections 4-7 from the day counts (see month_figures)
+    # ----------------------------
+    def _calculate_month_figures(self, std: Dict[str, int], actual: Dict[str, Any]) -> MonthFigures:
+        return month_figures(
+            std["F"],
+            std["H"],
+            actual["paid_workdays"],
+            actual["paid_holidays"],
+            self.inputs.gross_monthly,
+            self.inputs.annual_leave_days,
+            self.inputs.employer_insurance,
+        )
 
     # ----------------------------
     # Public: calculate one month row
@@ -196,15 +262,10 @@ class CalculationEngine:
     def calculate_month(self, year: int, month: int) -> Dict[str, Any]:
         std = self._calculate_standard_month_counts(year, month)
         actual = self._calculate_actual_paid_days(year, month)
-        leave = self._calculate_leave_days(year, month)
-        sal = self._calculate_salary_breakdown(year, month)
+        fig = self._calculate_month_figures(std, actual)
 
         ms, me = self._month_start_end(year, month)
 
-        O = sal["O"]
-        P = self._calculate_employer_insurance(O)
-        Q = self._calculate_total_company_cost(O=O, P=P, M=sal["M"], N=sal["N"])
-
         return {
             "year": year,
             "month": month,
@@ -221,18 +282,18 @@ class CalculationEngine:
             "paid_holidays": actual["paid_holidays"],
             "I": actual["I"],
             # Leave
-            "J": leave["J"],
-            "leave_ratio": leave["ratio"],
-            "leave_monthly_accrual": leave["monthly_accrual"],
+            "J": fig.J,
+            "leave_ratio": fig.leave_ratio,
+            "leave_monthly_accrual": fig.leave_monthly_accrual,
             # Salary
-            "K": sal["K"],
-            "L": sal["L"],
-            "M": sal["M"],
-            "N": sal["N"],
-            "O": sal["O"],
+            "K": fig.K,
+            "L": fig.L,
+            "M": fig.M,
+            "N": fig.N,
+            "O": fig.O,
             # Insurance + Total
-            "P": P,
-            "Q": Q,
+            "P": fig.P,
+            "Q": fig.Q,
         }
 
     # ----------------------------
@@ -242,4 +303,88 @@ class CalculationEngine:
         rows: List[Dict[str, Any]] = []
         for m in range(1, 13):
             rows.append(self.calculate_month(year, m))
-        return rows
\ No newline at end of file
+        return rows
+
+class RosterCalculationEngine:
+    """
+    Columnar counterpart of CalculationEngine for an EmployeeRoster.
+
+    - Standard counts (F,G,H) are computed once per month for everyone
+    - Per-employee day counts use closed-form Mon–Sat counting + bisect
+      on the holiday ordinals (no day-by-day loop)
+    - Per-employee results are typed arrays indexed like the roster
+    """
+
+    INT_COLUMNS = ("paid_workdays", "paid_holidays", "I")
+    FLOAT_COLUMNS = ("J", "leave_ratio", "K", "L", "M", "N", "O", "P", "Q")
+
+    def __init__(self, roster: EmployeeRoster, holidays: List[Holiday]):
+        self.roster = roster
+        self.holidays = holidays
+        self._holiday_ordinals = paid_holiday_ordinals(holidays)
+
+    def calculate_month(self, year: int, month: int) -> Dict[str, Any]:
+        ms, me = CalculationEngine._month_start_end(year, month)
+        ms_o, me_o = ms.toordinal(), me.toordinal()
+        hol = self._holiday_ordinals
+
+        G = count_ordinals_between(hol, ms_o, me_o)
+        F = count_mon_sat_days(ms_o, me_o) - G
+        H = F + G
+
+        r = self.roster
+        profiles = r.insurance_profiles
+        cols: Dict[str, array] = {c: array("i") for c in self.INT_COLUMNS}
+        cols.update({c: array("d") for c in self.FLOAT_COLUMNS})
+
+        for i in range(len(r)):
+            a = max(r.start_ordinal[i], ms_o)
+            b = min(r.end_ordinal[i], me_o)
+            if a > b:
+                paid_workdays = paid_holidays = 0
+            else:
+                paid_holidays = count_ordinals_between(hol, a, b)
+                paid_workdays = count_mon_sat_days(a, b) - paid_holidays
+
+            fig = month_figures(
+                F, H, paid_workdays, paid_holidays,
+                r.gross_monthly[i], r.annual_leave_days[i], profiles[r.insurance_index[i]],
+            )
+
+            cols["paid_workdays"].append(paid_workdays)
+            cols["paid_holidays"].append(paid_holidays)
+            cols["I"].append(fig.I)
+            cols["J"].append(fig.J)
+            cols["leave_ratio"].append(fig.leave_ratio)
+            cols["K"].append(fig.K)
+            cols["L"].append(fig.L)
+            cols["M"].append(fig.M)
+            cols["N"].append(fig.N)
+            cols["O"].append(fig.O)
+            cols["P"].append(fig.P)
+            cols["Q"].append(fig.Q)
+
+        return {
+            "year": year,
+            "month": month,
+            "month_start": ms,
+            "month_end": me,
+            "F": F,
+            "G": G,
+            "H": H,
+            **cols,
+        }
+
+    def calculate_year(self, year: int) -> List[Dict[str, Any]]:
+        return [self.calculate_month(year, m) for m in range(1, 13)]
+
+    def yearly_totals(self, year: int, column: str = "Q") -> array:
+        """
+        Per-employee sum of one money column over the 12 months.
+        """
+        totals = array("d", bytes(8 * len(self.roster)))
+        for row in self.calculate_year(year):
+            values = row[column]
+            for i in range(len(totals)):
+                totals[i] += values[i]
+        return totals
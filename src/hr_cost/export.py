@@ -0,0 +1,258 @@
+"""
+Per-employee cost workbooks (same layout as the app's Excel download),
+built in a process pool and streamed into a ZIP archive.
+
+Headless:
+    python -m hr_cost.export roster.csv --year 2026 --holidays holidays.csv --out sheets.zip
+    (add --snapshot roster.hrcs to skip CSV parsing on later runs)
+"""
+import argparse
+import io
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.context import BaseContext
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+from .calendar import load_holidays_csv
+from .engine import CalculationEngine
+from .models import EmployeeRoster, Holiday, Inputs
+from .snapshot import load_or_build, load_snapshot
+
+# Engine key -> column header used by the app's MONTHLY_COST table
+MONTHLY_COLUMNS = (
+    ("month", "Thang"),
+    ("month_start", "Ngay 1 cua thang"),
+    ("month_end", "Ngay cuoi thang"),
+    ("calc_start", "Bat dau tinh"),
+    ("calc_end", "Ket thuc tinh"),
+    ("F", "Ngay lam viec chuan"),
+    ("G", "Ngay nghi le"),
+    ("H", "Ngay cong chuan"),
+    ("I", "Ngay cong thuc te"),
+    ("J", "Phep nam thuc te"),
+    ("K", "Luong/ngay"),
+    ("L", "Chi phi lam viec"),
+    ("M", "Chi phi nghi phep"),
+    ("N", "Chi phi nghi le"),
+    ("O", "Tong luong phai tra"),
+    ("P", "BH NSDLĐ"),
+    ("Q", "TONG CHI PHI CÔNG TY"),
+)
+
+ProgressCallback = Callable[[int, int], None]
+
+
+def _require_openpyxl():
+    try:
+        from openpyxl import Workbook
+    except ImportError as e:
+        raise ImportError("Excel export requires openpyxl (pip install openpyxl)") from e
+    return Workbook
+
+
+# ----------------------------
+# Single workbook
+# ----------------------------
+def build_employee_workbook(
+    inputs: Inputs, holidays: List[Holiday], year: int, employee_id: str = ""
+) -> bytes:
+    Workbook = _require_openpyxl()
+    rows = CalculationEngine(inputs, holidays).calculate_year(year)
+    ins = inputs.employer_insurance
+
+    wb = Workbook()
+    ws1 = wb.active
+    ws1.title = "RESULT"
+
+    ws1.append(["INPUTS"])
+    for k, v in (
+        ("employee_id", employee_id),
+        ("gross", inputs.gross_monthly),
+        ("start_date", inputs.start_date.strftime("%d/%m/%Y")),
+        ("end_date", inputs.end_date.strftime("%d/%m/%Y")),
+        ("year", year),
+        ("annual_leave_days", inputs.annual_leave_days),
+        ("employer_ins_enabled", ins.enabled),
+        ("employer_ins_rate", ins.rate),
+        ("employer_ins_cap", ins.cap),
+    ):
+        ws1.append([k, v])
+    ws1.append([])
+    ws1.append(["MONTHLY_COST"])
+
+    ws1.append([header for _, header in MONTHLY_COLUMNS])
+    for row in rows:
+        values = [row[key] for key, _ in MONTHLY_COLUMNS]
+        values[0] = f"{row['month']:02d}"
+        ws1.append(values)
+
+    ws2 = wb.create_sheet("HOLIDAYS")
+    ws2.append(["date", "name"])
+    for h in sorted(holidays, key=lambda h: h.date):
+        ws2.append([h.date, h.name])
+
+    bio = io.BytesIO()
+    wb.save(bio)
+    return bio.getvalue()
+
+
+# ----------------------------
+# Pool workers (holidays/year are sent once per worker, not per task)
+# ----------------------------
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_worker(holidays: List[Holiday], year: int, snapshot_path: Optional[str] = None) -> None:
+    _worker_state["holidays"] = holidays
+    _worker_state["year"] = year
+    _worker_state["roster"] = load_snapshot(snapshot_path).roster if snapshot_path else None
+
+
+def _build_task(task: Tuple[int, str, Optional[Inputs]]) -> Tuple[int, bytes]:
+    i, employee_id, inputs = task
+    if inputs is None:
+        # Worker maps the snapshot itself; only the row index crosses processes
+        inputs = _worker_state["roster"].inputs(i)
+    data = build_employee_workbook(inputs, _worker_state["holidays"], _worker_state["year"], employee_id)
+    return i, data
+
+
+def workbook_names(roster: EmployeeRoster, year: int) -> List[str]:
+    """
+    Unique, filesystem-safe archive member names ("<employee_id>_<year>.xlsx").
+    """
+    names: List[str] = []
+    seen = set()
+    for i, employee_id in enumerate(roster.employee_ids):
+        stem = re.sub(r"[^\w.-]+", "_", employee_id).strip("._") or str(i + 1)
+        name = f"{stem}_{year}.xlsx"
+        k = i + 1
+        while name in seen:
+            name = f"{stem}_{k}_{year}.xlsx"
+            k += 1
+        seen.add(name)
+        names.append(name)
+    return names
+
+
+def export_roster_zip(
+    roster: EmployeeRoster,
+    holidays: List[Holiday],
+    year: int,
+    dest: Union[str, BinaryIO],
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    snapshot_path: Optional[str] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> int:
+    """
+    Write one workbook per employee into a ZIP at dest (path or binary file).
+
+    - Workbooks are written as soon as each one finishes (completion order)
+    - At most 2 * workers tasks are in flight, so memory stays bounded
+      regardless of roster size
+    - max_workers=0 builds everything in-process (no pool)
+    - progress(done, total) is called after each workbook is written
+    - snapshot_path: roster snapshot (hr_cost.snapshot) that each worker
+      memory-maps, so tasks carry only a row index
+    - mp_context: multiprocessing context for the pool (e.g. "spawn" when
+      called from a multi-threaded server such as Streamlit)
+
+    Returns the number of workbooks written.
+    """
+    _require_openpyxl()
+    total = len(roster)
+
+    if snapshot_path:
+        # Names come from roster, numbers from the workers' snapshot: they must agree
+        snap_roster = load_snapshot(snapshot_path).roster
+        if len(snap_roster) != total or list(snap_roster.employee_ids) != list(roster.employee_ids):
+            raise ValueError(f"roster does not match snapshot {snapshot_path}")
+    names = workbook_names(roster, year)
+
+    def task(i: int) -> Tuple[int, str, Optional[Inputs]]:
+        return i, roster.employee_ids[i], None if snapshot_path else roster.inputs(i)
+
+    # .xlsx is already deflate-compressed, store as-is
+    with zipfile.ZipFile(dest, "w", compression=zipfile.ZIP_STORED) as zf:
+        done = 0
+
+        if max_workers == 0:
+            _init_worker(holidays, year, snapshot_path)
+            for i in range(total):
+                _, data = _build_task(task(i))
+                zf.writestr(names[i], data)
+                done += 1
+                if progress:
+                    progress(done, total)
+            return done
+
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(holidays, year, snapshot_path),
+        ) as pool:
+            window = 2 * workers
+            next_i = 0
+            pending = set()
+
+            while next_i < total and len(pending) < window:
+                pending.add(pool.submit(_build_task, task(next_i)))
+                next_i += 1
+
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    i, data = fut.result()
+                    zf.writestr(names[i], data)
+                    done += 1
+                    if progress:
+                        progress(done, total)
+                    if next_i < total:
+                        pending.add(pool.submit(_build_task, task(next_i)))
+                        next_i += 1
+
+    return done
+
+
+# ----------------------------
+# Headless entry point
+# ----------------------------
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Bulk per-employee cost workbooks -> ZIP")
+    parser.add_argument("roster", help="roster CSV (employee_id, gross_monthly, start_date, end_date, ...)")
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--holidays", help="holiday CSV (date, name)")
+    parser.add_argument("--out", help="output ZIP path (default: cost_sheets_<year>.zip)")
+    parser.add_argument("--workers", type=int, default=None, help="process count (0 = in-process)")
+    parser.add_argument("--snapshot", help="binary snapshot path, reused while the CSV inputs are unchanged")
+    args = parser.parse_args(argv)
+
+    if args.snapshot:
+        snap = load_or_build(args.snapshot, args.roster, args.holidays)
+        roster, holidays = snap.roster, snap.holidays
+    else:
+        roster = EmployeeRoster.from_csv(args.roster)
+        holidays = load_holidays_csv(args.holidays) if args.holidays else []
+    out = args.out or f"cost_sheets_{args.year}.zip"
+
+    def report(done: int, total: int) -> None:
+        sys.stderr.write(f"\r{done}/{total}")
+        if done == total:
+            sys.stderr.write("\n")
+
+    count = export_roster_zip(
+        roster, holidays, args.year, out,
+        max_workers=args.workers, progress=report, snapshot_path=args.snapshot,
+    )
+    print(f"{count} workbooks -> {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
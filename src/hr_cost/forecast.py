@@ -0,0 +1,146 @@
+from collections import defaultdict
+from datetime import date
+from typing import Any, DefaultDict, Dict, Iterable, List, Tuple
+
+from .calendar import DayCounts
+from .engine import CalculationEngine, month_figures
+from .models import EmployerInsurance, Holiday, PlannedPosition
+
+# Cost profile: everything that changes the per-person numbers (role/band are labels only)
+Profile = Tuple[float, float, EmployerInsurance]
+
+SUM_COLUMNS = ("I", "J", "L", "M", "N", "O", "P", "Q")
+
+
+class HeadcountForecast:
+    """
+    Company-wide monthly cost curve for a headcount plan.
+
+    - Plan lines are grouped by cost profile (gross, leave, insurance)
+    - Full months are accumulated with difference arrays over the month grid
+      (+count at the first full month, -count after the last one)
+    - Partial boundary months are grouped by (month, active range) and
+      evaluated once per distinct range
+
+    Cost evaluation is O(months x profiles + distinct boundary ranges),
+    independent of how many people share them. The calendar (month grid +
+    DayCounts) is built once, so several scenarios can reuse one instance.
+    """
+
+    def __init__(self, holidays: List[Holiday], start_date: date, end_date: date):
+        if end_date < start_date:
+            raise ValueError("end_date must not be before start_date")
+
+        first_ms = date(start_date.year, start_date.month, 1)
+        _, last_me = CalculationEngine._month_start_end(end_date.year, end_date.month)
+        self.days = DayCounts(first_ms, last_me, holidays)
+
+        # (year, month, ms_o, me_o, F, G, H)
+        self.months: List[Tuple[int, int, int, int, int, int, int]] = []
+        y, m = first_ms.year, first_ms.month
+        while (y, m) <= (end_date.year, end_date.month):
+            ms, me = CalculationEngine._month_start_end(y, m)
+            ms_o, me_o = ms.toordinal(), me.toordinal()
+            F = self.days.count_workdays(ms_o, me_o)
+            G = self.days.count_paid_holidays(ms_o, me_o)
+            self.months.append((y, m, ms_o, me_o, F, G, F + G))
+            y, m = (y + 1, 1) if m == 12 else (y, m + 1)
+
+        self._month_index = {(y, m): i for i, (y, m, *_) in enumerate(self.months)}
+
+    def _index_of(self, ordinal: int) -> int:
+        d = date.fromordinal(ordinal)
+        return self._month_index[(d.year, d.month)]
+
+    def run(self, plan: Iterable[PlannedPosition]) -> List[Dict[str, Any]]:
+        n = len(self.months)
+        first_o = self.months[0][2]
+        last_o = self.months[-1][3]
+
+        headcount_diff = [0] * (n + 1)
+        full_diff: DefaultDict[Profile, List[int]] = defaultdict(lambda: [0] * (n + 1))
+        partial: DefaultDict[Tuple[Profile, int, int, int], int] = defaultdict(int)
+
+        # ----------------------------
+        # Accumulate events
+        # ----------------------------
+        for pos in plan:
+            s = max(pos.start_date.toordinal(), first_o)
+            e = min(pos.end_date.toordinal(), last_o)
+            if s > e or pos.count <= 0:
+                continue
+
+            c = pos.count
+            profile = (float(pos.gross_monthly), float(pos.annual_leave_days), pos.employer_insurance)
+            ms_i, me_i = self._index_of(s), self._index_of(e)
+
+            headcount_diff[ms_i] += c
+            headcount_diff[me_i + 1] -= c
+
+            starts_on_month_start = s == self.months[ms_i][2]
+            ends_on_month_end = e == self.months[me_i][3]
+            first_full = ms_i if starts_on_month_start else ms_i + 1
+            last_full = me_i if ends_on_month_end else me_i - 1
+
+            if ms_i == me_i and not (starts_on_month_start and ends_on_month_end):
+                partial[(profile, ms_i, s, e)] += c
+            else:
+                if not starts_on_month_start:
+                    partial[(profile, ms_i, s, self.months[ms_i][3])] += c
+                if not ends_on_month_end:
+                    partial[(profile, me_i, self.months[me_i][2], e)] += c
+
+            if first_full <= last_full:
+                diff = full_diff[profile]
+                diff[first_full] += c
+                diff[last_full + 1] -= c
+
+        totals = [dict.fromkeys(SUM_COLUMNS, 0.0) for _ in range(n)]
+
+        def add(i: int, fig, count: int) -> None:
+            row = totals[i]
+            for key in SUM_COLUMNS:
+                row[key] += getattr(fig, key) * count
+
+        # ----------------------------
+        # Full months: months x profiles
+        # ----------------------------
+        for (gross, leave, ins), diff in full_diff.items():
+            active = 0
+            for i in range(n):
+                active += diff[i]
+                if active:
+                    _, _, _, _, F, G, H = self.months[i]
+                    add(i, month_figures(F, H, F, G, gross, leave, ins), active)
+
+        # ----------------------------
+        # Boundary months: one evaluation per distinct range
+        # ----------------------------
+        for ((gross, leave, ins), i, a, b), count in partial.items():
+            _, _, _, _, F, G, H = self.months[i]
+            paid_workdays = self.days.count_workdays(a, b)
+            paid_holidays = self.days.count_paid_holidays(a, b)
+            add(i, month_figures(F, H, paid_workdays, paid_holidays, gross, leave, ins), count)
+
+        rows: List[Dict[str, Any]] = []
+        headcount = 0
+        for i, (y, m, ms_o, me_o, F, G, H) in enumerate(self.months):
+            headcount += headcount_diff[i]
+            rows.append({
+                "year": y,
+                "month": m,
+                "month_start": date.fromordinal(ms_o),
+                "month_end": date.fromordinal(me_o),
+                "F": F,
+                "G": G,
+                "H": H,
+                "headcount": headcount,
+                **totals[i],
+            })
+        return rows
+
+
+def forecast_headcount_plan(
+    plan: Iterable[PlannedPosition], holidays: List[Holiday], start_date: date, end_date: date
+) -> List[Dict[str, Any]]:
+    return HeadcountForecast(holidays, start_date, end_date).run(plan)
@@ -1,5 +1,8 @@
+import csv
+from array import array
 from dataclasses import dataclass, field
-from datetime import date
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 
 @dataclass(frozen=True)
@@ -21,4 +24,269 @@ class Inputs:
 @dataclass(frozen=True)
 class Holiday:
     date: date
-    name: str = ""
\ No newline at end of file
+    name: str = ""
+
+
+@dataclass(frozen=True)
+class PlannedPosition:
+    """
+    One line of a headcount plan: `count` people with the same profile
+    hired on start_date and leaving on end_date.
+    """
+    role: str
+    band: str
+    gross_monthly: float
+    start_date: date
+    end_date: date
+    annual_leave_days: float = 12.0
+    employer_insurance: EmployerInsurance = field(default_factory=EmployerInsurance)
+    count: int = 1
+
+
+# ----------------------------
+# Columnar roster
+# ----------------------------
+ROSTER_COLUMNS = (
+    "employee_id",
+    "gross_monthly",
+    "start_date",
+    "end_date",
+    "annual_leave_days",
+    "insurance_enabled",
+    "insurance_rate",
+    "insurance_cap",
+)
+
+_TRUE_STRINGS = {"1", "true", "yes", "y", "x", "co", "có"}
+
+
+def to_ordinal(value: Any) -> int:
+    """
+    date / datetime / pandas Timestamp / "YYYY-MM-DD" / "DD/MM/YYYY" -> date ordinal.
+    """
+    if isinstance(value, datetime):
+        return value.date().toordinal()
+    if hasattr(value, "toordinal"):
+        return value.toordinal()
+    text = str(value).strip()
+    try:
+        return date.fromisoformat(text[:10]).toordinal()
+    except ValueError:
+        pass
+    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(text, fmt).date().toordinal()
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid date: {value!r}")
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    None / blank string / NaN / NaT (blank cells from csv or pandas).
+    """
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    try:
+        return value != value
+    except (TypeError, ValueError):
+        return False
+
+
+def _to_id(value: Any) -> str:
+    """
+    Employee id as text; integral floats (pandas upcasts an int id column
+    with a blank cell to float) lose the trailing ".0".
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    return bool(value)
+
+
+@dataclass
+class EmployeeRoster:
+    """
+    Columnar employee list (one typed array per field, row i = employee i).
+
+    Dates are stored as date ordinals. Insurance settings are interned:
+    insurance_index[i] points into insurance_profiles, so 100k employees
+    sharing one policy hold a single EmployerInsurance object.
+    """
+
+    employee_ids: List[str] = field(default_factory=list)
+    gross_monthly: Sequence[float] = field(default_factory=lambda: array("d"))
+    start_ordinal: Sequence[int] = field(default_factory=lambda: array("i"))
+    end_ordinal: Sequence[int] = field(default_factory=lambda: array("i"))
+    annual_leave_days: Sequence[float] = field(default_factory=lambda: array("d"))
+    insurance_index: Sequence[int] = field(default_factory=lambda: array("I"))
+    insurance_profiles: List[EmployerInsurance] = field(default_factory=list)
+    _profile_lookup: Dict[EmployerInsurance, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        for idx, profile in enumerate(self.insurance_profiles):
+            self._profile_lookup.setdefault(profile, idx)
+
+    def __len__(self) -> int:
+        return len(self.gross_monthly)
+
+    # ----------------------------
+    # Building
+    # ----------------------------
+    def intern_insurance(self, insurance: EmployerInsurance) -> int:
+        idx = self._profile_lookup.get(insurance)
+        if idx is None:
+            idx = len(self.insurance_profiles)
+            self.insurance_profiles.append(insurance)
+            self._profile_lookup[insurance] = idx
+        return idx
+
+    def append(
+        self,
+        gross_monthly: float,
+        start_date: date,
+        end_date: date,
+        annual_leave_days: float = 12.0,
+        employer_insurance: Optional[EmployerInsurance] = None,
+        employee_id: Optional[str] = None,
+    ) -> None:
+        if employer_insurance is None:
+            employer_insurance = EmployerInsurance()
+        if employee_id is None:
+            employee_id = str(len(self) + 1)
+
+        self.employee_ids.append(employee_id)
+        self.gross_monthly.append(float(gross_monthly))
+        self.start_ordinal.append(to_ordinal(start_date))
+        self.end_ordinal.append(to_ordinal(end_date))
+        self.annual_leave_days.append(float(annual_leave_days))
+        self.insurance_index.append(self.intern_insurance(employer_insurance))
+
+    # ----------------------------
+    # Row access
+    # ----------------------------
+    def inputs(self, i: int) -> Inputs:
+        """
+        Materialize row i as an Inputs object (for CalculationEngine / exports).
+        """
+        return Inputs(
+            gross_monthly=self.gross_monthly[i],
+            start_date=date.fromordinal(self.start_ordinal[i]),
+            end_date=date.fromordinal(self.end_ordinal[i]),
+            annual_leave_days=self.annual_leave_days[i],
+            employer_insurance=self.insurance_profiles[self.insurance_index[i]],
+        )
+
+    # ----------------------------
+    # Constructors
+    # ----------------------------
+    @classmethod
+    def from_inputs(cls, rows: Iterable[Inputs], employee_ids: Optional[Iterable[str]] = None) -> "EmployeeRoster":
+        roster = cls()
+        ids = iter(employee_ids) if employee_ids is not None else None
+        for row in rows:
+            roster.append(
+                gross_monthly=row.gross_monthly,
+                start_date=row.start_date,
+                end_date=row.end_date,
+                annual_leave_days=row.annual_leave_days,
+                employer_insurance=row.employer_insurance,
+                employee_id=next(ids) if ids is not None else None,
+            )
+        return roster
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, Sequence[Any]]) -> "EmployeeRoster":
+        """
+        Build from column name -> values (see ROSTER_COLUMNS).
+        gross_monthly, start_date and end_date are required (blank cells raise
+        ValueError); missing columns or blank / NaN cells in the other columns
+        fall back to the Inputs / EmployerInsurance defaults.
+        """
+        missing = [c for c in ("gross_monthly", "start_date", "end_date") if c not in columns]
+        if missing:
+            raise ValueError(f"Missing roster columns: {', '.join(missing)}")
+
+        n = len(columns["gross_monthly"])
+        default_ins = EmployerInsurance()
+
+        def required(name: str, convert):
+            values = columns[name]
+            out = []
+            for i in range(n):
+                if _is_missing(values[i]):
+                    raise ValueError(f"Row {i + 1}: {name} is empty")
+                out.append(convert(values[i]))
+            return out
+
+        def optional(name: str, convert, default):
+            values = columns.get(name)
+            if values is None:
+                return [default] * n
+            return [default if _is_missing(x) else convert(x) for x in values]
+
+        ids = optional("employee_id", _to_id, None)
+        enabled = optional("insurance_enabled", _to_bool, default_ins.enabled)
+        rate = optional("insurance_rate", float, default_ins.rate)
+        cap = optional("insurance_cap", float, default_ins.cap)
+
+        roster = cls(
+            employee_ids=[x if x is not None else str(i + 1) for i, x in enumerate(ids)],
+            gross_monthly=array("d", required("gross_monthly", float)),
+            start_ordinal=array("i", required("start_date", to_ordinal)),
+            end_ordinal=array("i", required("end_date", to_ordinal)),
+            annual_leave_days=array("d", optional("annual_leave_days", float, 12.0)),
+        )
+
+        # Intern (enabled, rate, cap) keys without building one object per row
+        keys: Dict[Tuple[bool, float, float], int] = {}
+        index = array("I")
+        for key in zip(enabled, rate, cap):
+            idx = keys.get(key)
+            if idx is None:
+                idx = roster.intern_insurance(EmployerInsurance(*key))
+                keys[key] = idx
+            index.append(idx)
+        roster.insurance_index = index
+
+        return roster
+
+    @classmethod
+    def from_csv(cls, source: Any, delimiter: str = ",") -> "EmployeeRoster":
+        """
+        source: path or text file object. Header row uses ROSTER_COLUMNS names.
+        """
+        if isinstance(source, (str, bytes)) or hasattr(source, "__fspath__"):
+            with open(source, newline="", encoding="utf-8-sig") as f:
+                return cls.from_csv(f, delimiter=delimiter)
+
+        reader = csv.reader(source, delimiter=delimiter)
+        header = [h.strip().lower() for h in next(reader)]
+        columns: Dict[str, List[str]] = {name: [] for name in header}
+        for line, row in enumerate(reader, start=2):
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) > len(header):
+                raise ValueError(f"Line {line}: {len(row)} fields, header has {len(header)}")
+            # Short rows: trailing fields left off count as blank cells
+            row = row + [""] * (len(header) - len(row))
+            for name, cell in zip(header, row):
+                columns[name].append(cell)
+        return cls.from_columns(columns)
+
+    @classmethod
+    def from_dataframe(cls, df: Any) -> "EmployeeRoster":
+        """
+        pandas DataFrame with ROSTER_COLUMNS names (pandas is not imported here).
+        """
+        columns = {str(c).strip().lower(): df[c].tolist() for c in df.columns}
+        return cls.from_columns(columns)
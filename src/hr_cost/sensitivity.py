@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from .calendar import DayCounts
+from .engine import CalculationEngine, month_figures
+from .models import EmployerInsurance, Holiday
+
+
+class DateSensitivity:
+    """
+    Yearly / monthly company cost (Q) for every possible start date
+    (or end date) in a year, in one pass over the days.
+
+    Only the month containing the varying date changes; every other month
+    is either 0 or a fixed "tail"/"head" cost. With per-day cumulative
+    counts (DayCounts) each partial month is O(1), and suffix/prefix sums
+    of the fixed months make each yearly total O(1).
+    """
+
+    def __init__(
+        self,
+        gross_monthly: float,
+        year: int,
+        holidays: List[Holiday],
+        annual_leave_days: float = 12.0,
+        employer_insurance: Optional[EmployerInsurance] = None,
+        days: Optional[DayCounts] = None,
+    ):
+        self.gross_monthly = gross_monthly
+        self.year = year
+        self.annual_leave_days = annual_leave_days
+        self.employer_insurance = employer_insurance or EmployerInsurance()
+
+        # days: optional pre-built (shared) DayCounts covering the year
+        self.days = days or DayCounts(date(year, 1, 1), date(year, 12, 31), holidays)
+
+        # (month_start_ordinal, month_end_ordinal, F, H) for months 1..12
+        self.months = []
+        for m in range(1, 13):
+            ms, me = CalculationEngine._month_start_end(year, m)
+            ms_o, me_o = ms.toordinal(), me.toordinal()
+            F = self.days.count_workdays(ms_o, me_o)
+            G = self.days.count_paid_holidays(ms_o, me_o)
+            self.months.append((ms_o, me_o, F, F + G))
+
+    def _month_cost(self, m: int, start_ordinal: int, end_ordinal: int) -> float:
+        """
+        Q of month m (0-based) for an active range [start_ordinal, end_ordinal].
+        """
+        ms_o, me_o, F, H = self.months[m]
+        a = max(start_ordinal, ms_o)
+        b = min(end_ordinal, me_o)
+        if a > b:
+            paid_workdays = paid_holidays = 0
+        else:
+            paid_workdays = self.days.count_workdays(a, b)
+            paid_holidays = self.days.count_paid_holidays(a, b)
+        return month_figures(
+            F, H, paid_workdays, paid_holidays,
+            self.gross_monthly, self.annual_leave_days, self.employer_insurance,
+        ).Q
+
+    def _days_of_year(self):
+        d = date(self.year, 1, 1)
+        while d.year == self.year:
+            yield d
+            d += timedelta(days=1)
+
+    # ----------------------------
+    # Public: vary start date, fixed end date
+    # ----------------------------
+    def by_start_date(self, end_date: Optional[date] = None, monthly: bool = False) -> List[Dict[str, Any]]:
+        """
+        One row per day of the year: {"date", "Q"} (+ "monthly_Q" tuple of 12 if monthly).
+        end_date defaults to 31/12 of the year.
+        """
+        end_o = (end_date or date(self.year, 12, 31)).toordinal()
+
+        # tail[m] = cost of month m when hired before it; suffix[m] = sum tail[m:]
+        tail = [self._month_cost(m, self.months[m][0], end_o) for m in range(12)]
+        suffix = [0.0] * 13
+        for m in range(11, -1, -1):
+            suffix[m] = suffix[m + 1] + tail[m]
+
+        rows: List[Dict[str, Any]] = []
+        for d in self._days_of_year():
+            m = d.month - 1
+            partial = self._month_cost(m, d.toordinal(), end_o)
+            row: Dict[str, Any] = {"date": d, "Q": partial + suffix[m + 1]}
+            if monthly:
+                row["monthly_Q"] = (0.0,) * m + (partial,) + tuple(tail[m + 1:])
+            rows.append(row)
+        return rows
+
+    # ----------------------------
+    # Public: vary end date, fixed start date
+    # ----------------------------
+    def by_end_date(self, start_date: Optional[date] = None, monthly: bool = False) -> List[Dict[str, Any]]:
+        """
+        One row per day of the year: {"date", "Q"} (+ "monthly_Q" tuple of 12 if monthly).
+        start_date defaults to 01/01 of the year.
+        """
+        start_o = (start_date or date(self.year, 1, 1)).toordinal()
+
+        # head[m] = cost of month m when leaving after it; prefix[m] = sum head[:m]
+        head = [self._month_cost(m, start_o, self.months[m][1]) for m in range(12)]
+        prefix = [0.0] * 13
+        for m in range(12):
+            prefix[m + 1] = prefix[m] + head[m]
+
+        rows: List[Dict[str, Any]] = []
+        for d in self._days_of_year():
+            m = d.month - 1
+            partial = self._month_cost(m, start_o, d.toordinal())
+            row: Dict[str, Any] = {"date": d, "Q": prefix[m] + partial}
+            if monthly:
+                row["monthly_Q"] = tuple(head[:m]) + (partial,) + (0.0,) * (11 - m)
+            rows.append(row)
+        return rows
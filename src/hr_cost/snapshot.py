@@ -0,0 +1,264 @@
+"""
+Binary roster / holiday snapshot (.hrcs), written once from parsed input
+and memory-mapped on reload.
+
+Layout (little-endian, every section 8-byte aligned):
+  header      magic "HRCS", version, counts, string blob size, sha256 fingerprint
+  roster      gross f8[n] | leave f8[n] | start i4[n] | end i4[n] | insurance_index u4[n]
+  profiles    rate f8[p] | cap f8[p] | enabled u1[p]
+  holidays    date ordinal i4[h]
+  strings     offsets u4[n + h + 1] | utf-8 blob   (employee ids, then holiday names)
+"""
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import date
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from .calendar import load_holidays_csv
+from .models import EmployeeRoster, EmployerInsurance, Holiday
+
+MAGIC = b"HRCS"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIQ32s")
+NO_FINGERPRINT = bytes(32)
+
+
+class StaleSnapshotError(ValueError):
+    """Snapshot fingerprint does not match the current source file."""
+
+
+class Snapshot(NamedTuple):
+    roster: EmployeeRoster
+    holidays: List[Holiday]
+    fingerprint: bytes
+
+
+def source_fingerprint(sources: Sequence[str]) -> bytes:
+    """
+    sha256 over the raw source files, in order (hashing is far cheaper than parsing).
+    """
+    h = hashlib.sha256()
+    for path in sources:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        h.update(b"\0")
+    return h.digest()
+
+
+def _pad(size: int) -> int:
+    return (-size) % 8
+
+
+def _le_bytes(typecode: str, values: Sequence) -> bytes:
+    arr = array(typecode, values)
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class StringTable(Sequence[str]):
+    """
+    Read-only string column decoded lazily from the mapped blob.
+    """
+
+    def __init__(self, offsets: Sequence[int], blob: memoryview, start: int, count: int):
+        self._offsets = offsets
+        self._blob = blob
+        self._start = start
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        k = self._start + i
+        return bytes(self._blob[self._offsets[k]:self._offsets[k + 1]]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i]
+
+
+# ----------------------------
+# Write
+# ----------------------------
+def write_snapshot(
+    path: str,
+    roster: EmployeeRoster,
+    holidays: Sequence[Holiday] = (),
+    sources: Sequence[str] = (),
+) -> bytes:
+    """
+    Write roster + holidays to path. The fingerprint of the source files
+    (roster / holiday CSVs) is stored so load_snapshot can detect a stale
+    snapshot. Returns the fingerprint.
+    """
+    fingerprint = source_fingerprint(sources) if sources else NO_FINGERPRINT
+    n = len(roster)
+    profiles = roster.insurance_profiles
+
+    encoded = [s.encode("utf-8") for s in roster.employee_ids]
+    encoded += [h.name.encode("utf-8") for h in holidays]
+    offsets = [0]
+    for s in encoded:
+        offsets.append(offsets[-1] + len(s))
+    blob = b"".join(encoded)
+
+    sections = [
+        _le_bytes("d", roster.gross_monthly),
+        _le_bytes("d", roster.annual_leave_days),
+        _le_bytes("i", roster.start_ordinal),
+        _le_bytes("i", roster.end_ordinal),
+        _le_bytes("I", roster.insurance_index),
+        _le_bytes("d", [float(p.rate) for p in profiles]),
+        _le_bytes("d", [float(p.cap) for p in profiles]),
+        bytes(1 if p.enabled else 0 for p in profiles),
+        _le_bytes("i", [h.date.toordinal() for h in holidays]),
+        _le_bytes("I", offsets),
+        blob,
+    ]
+
+    header = _HEADER.pack(MAGIC, VERSION, 0, n, len(profiles), len(holidays), len(blob), fingerprint)
+
+    # Write a sibling temp file and swap it in: readers that have the old
+    # file mapped keep a valid mapping, and a crash never leaves a partial file
+    fd, tmp_path = tempfile.mkstemp(prefix=".hrcs-", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(bytes(_pad(len(header))))
+            for section in sections:
+                f.write(section)
+                f.write(bytes(_pad(len(section))))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return fingerprint
+
+
+# ----------------------------
+# Read
+# ----------------------------
+def read_fingerprint(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return _parse_header(f.read(_HEADER.size), os.fstat(f.fileno()).st_size)[-1]
+
+
+def _expected_size(n: int, p: int, h: int, blob_size: int) -> int:
+    sizes = [_HEADER.size, 8 * n, 8 * n, 4 * n, 4 * n, 4 * n, 8 * p, 8 * p, p, 4 * h, 4 * (n + h + 1), blob_size]
+    return sum(size + _pad(size) for size in sizes)
+
+
+def _parse_header(raw: bytes, file_size: int) -> Tuple[int, int, int, int, bytes]:
+    if len(raw) < _HEADER.size:
+        raise ValueError("Not a roster snapshot (file too short)")
+    magic, version, _, n, p, h, blob_size, fingerprint = _HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        raise ValueError("Not a roster snapshot (bad magic)")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    expected = _expected_size(n, p, h, blob_size)
+    if file_size != expected:
+        raise ValueError(f"Corrupt roster snapshot (size {file_size}, header declares {expected})")
+    return n, p, h, blob_size, fingerprint
+
+
+def load_snapshot(path: str, sources: Optional[Sequence[str]] = None) -> Snapshot:
+    """
+    Memory-map a snapshot. Numeric roster columns are zero-copy read-only
+    views into the mapping; employee ids are decoded on access.
+    Raises StaleSnapshotError if sources are given and their content changed.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        n, p, h, blob_size, fingerprint = _parse_header(mm, len(mm))
+        if sources is not None and fingerprint != source_fingerprint(sources):
+            raise StaleSnapshotError(f"{path} is stale for {', '.join(sources)}")
+    except BaseException:
+        mm.close()
+        raise
+
+    # Sizes are validated above, so the section views below cannot run short
+    mv = memoryview(mm)
+
+    pos = _HEADER.size + _pad(_HEADER.size)
+
+    def take(typecode: str, count: int, itemsize: int):
+        nonlocal pos
+        size = count * itemsize
+        raw = mv[pos:pos + size]
+        pos += size + _pad(size)
+        if typecode == "B":
+            return raw
+        if sys.byteorder != "little":
+            arr = array(typecode, raw.tobytes())
+            arr.byteswap()
+            return arr
+        return raw.cast(typecode)
+
+    gross = take("d", n, 8)
+    leave = take("d", n, 8)
+    start = take("i", n, 4)
+    end = take("i", n, 4)
+    insurance_index = take("I", n, 4)
+    rates = take("d", p, 8)
+    caps = take("d", p, 8)
+    enabled = take("B", p, 1)
+    holiday_ordinals = take("i", h, 4)
+    offsets = take("I", n + h + 1, 4)
+    blob = take("B", blob_size, 1)
+
+    roster = EmployeeRoster(
+        employee_ids=StringTable(offsets, blob, 0, n),
+        gross_monthly=gross,
+        start_ordinal=start,
+        end_ordinal=end,
+        annual_leave_days=leave,
+        insurance_index=insurance_index,
+        insurance_profiles=[
+            EmployerInsurance(enabled=bool(enabled[i]), rate=rates[i], cap=caps[i]) for i in range(p)
+        ],
+    )
+    names = StringTable(offsets, blob, n, h)
+    holidays = [Holiday(date=date.fromordinal(o), name=names[i]) for i, o in enumerate(holiday_ordinals)]
+
+    return Snapshot(roster=roster, holidays=holidays, fingerprint=fingerprint)
+
+
+def load_or_build(
+    snapshot_path: str,
+    roster_source: str,
+    holidays_source: Optional[str] = None,
+) -> Snapshot:
+    """
+    Reuse snapshot_path if it matches the source files, otherwise parse
+    them, (re)write the snapshot and load it.
+    """
+    sources = [roster_source] + ([holidays_source] if holidays_source else [])
+    try:
+        return load_snapshot(snapshot_path, sources=sources)
+    except (OSError, ValueError):
+        pass
+    roster = EmployeeRoster.from_csv(roster_source)
+    holidays = load_holidays_csv(holidays_source) if holidays_source else []
+    write_snapshot(snapshot_path, roster, holidays, sources=sources)
+    return load_snapshot(snapshot_path)
@@ -0,0 +1,165 @@
+import math
+from bisect import bisect_right
+from datetime import date
+from typing import List, Optional, Sequence
+
+from .calendar import DayCounts
+from .engine import CalculationEngine, month_figures
+from .models import EmployeeRoster, EmployerInsurance, Holiday
+
+
+class GrossSolver:
+    """
+    Inverse of CalculationEngine: highest gross_monthly whose yearly Q stays
+    within a budget, for fixed dates / leave / insurance.
+
+    With the day counts fixed, each month is linear in gross (K = gross / H):
+      O + M + N = (I + J + paid_holidays) / H * gross
+      P         = rate * min(I / H * gross, cap)
+    so yearly Q is piecewise-linear and increasing, with one breakpoint per
+    month at gross = cap * H / I (where that month's O reaches the cap).
+    Breakpoints are sorted once; each budget is then a bisect + one division.
+    """
+
+    MAX_CORRECTION_STEPS = 64
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        year: int,
+        holidays: List[Holiday],
+        annual_leave_days: float = 12.0,
+        employer_insurance: Optional[EmployerInsurance] = None,
+        days: Optional[DayCounts] = None,
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.year = year
+        self.annual_leave_days = annual_leave_days
+        self.employer_insurance = employer_insurance or EmployerInsurance()
+        if days is None:
+            days = DayCounts(date(year, 1, 1), date(year, 12, 31), holidays)
+
+        start_o, end_o = start_date.toordinal(), end_date.toordinal()
+
+        # (F, H, paid_workdays, paid_holidays) per month
+        self.month_counts = []
+        for m in range(1, 13):
+            ms, me = CalculationEngine._month_start_end(year, m)
+            ms_o, me_o = ms.toordinal(), me.toordinal()
+            F = days.count_workdays(ms_o, me_o)
+            H = F + days.count_paid_holidays(ms_o, me_o)
+            a, b = max(start_o, ms_o), min(end_o, me_o)
+            self.month_counts.append(
+                (F, H, days.count_workdays(a, b), days.count_paid_holidays(a, b))
+            )
+
+        self._build_segments()
+
+    def _build_segments(self) -> None:
+        ins = self.employer_insurance
+        rate = float(ins.rate) if ins.enabled else 0.0
+        capped = bool(ins.enabled and ins.cap and ins.cap > 0)
+
+        slope = 0.0                  # d(Q)/d(gross) before any breakpoint
+        breakpoints = []             # (gross, slope lost after it)
+        for F, H, paid_workdays, paid_holidays in self.month_counts:
+            if H <= 0:
+                continue
+            # J does not depend on gross: evaluate once at gross = 0
+            fig = month_figures(F, H, paid_workdays, paid_holidays, 0.0, self.annual_leave_days, ins)
+            b = fig.I / float(H)
+            slope += (fig.I + fig.J + paid_holidays) / float(H) + rate * b
+            if capped and b > 0:
+                breakpoints.append((float(ins.cap) / b, rate * b))
+
+        breakpoints.sort()
+        self.initial_slope = slope
+        self.breakpoint_gross = [0.0]
+        self.breakpoint_cost = [0.0]
+        self.segment_slope = [slope]
+        for g, lost in breakpoints:
+            q = self.breakpoint_cost[-1] + self.segment_slope[-1] * (g - self.breakpoint_gross[-1])
+            self.breakpoint_gross.append(g)
+            self.breakpoint_cost.append(q)
+            self.segment_slope.append(self.segment_slope[-1] - lost)
+
+    # ----------------------------
+    # Forward (same arithmetic as CalculationEngine)
+    # ----------------------------
+    def yearly_cost(self, gross_monthly: float) -> float:
+        total = 0.0
+        for F, H, paid_workdays, paid_holidays in self.month_counts:
+            total += month_figures(
+                F, H, paid_workdays, paid_holidays,
+                gross_monthly, self.annual_leave_days, self.employer_insurance,
+            ).Q
+        return total
+
+    # ----------------------------
+    # Inverse
+    # ----------------------------
+    def max_gross(self, budget: float, verify: bool = True) -> float:
+        """
+        Highest gross_monthly with yearly Q <= budget.
+        math.inf if the employee is not paid in the year (Q is always 0).
+        """
+        if budget < 0:
+            raise ValueError("budget must be >= 0")
+        if self.initial_slope <= 0:
+            return math.inf
+
+        j = bisect_right(self.breakpoint_cost, budget) - 1
+        slope = self.segment_slope[j]
+        if slope <= 0:
+            return math.inf
+        gross = self.breakpoint_gross[j] + (budget - self.breakpoint_cost[j]) / slope
+
+        if verify:
+            # Float rounding can put the forward Q a few ulps over budget
+            for _ in range(self.MAX_CORRECTION_STEPS):
+                excess = self.yearly_cost(gross) - budget
+                if excess <= 0:
+                    break
+                gross = max(0.0, min(math.nextafter(gross, 0.0), gross - excess / slope))
+            else:
+                if self.yearly_cost(gross) <= budget:
+                    return gross
+                raise ArithmeticError(
+                    f"max_gross({budget}) did not converge: forward cost still exceeds budget"
+                )
+        return gross
+
+    def max_gross_many(self, budgets: Sequence[float], verify: bool = True) -> List[float]:
+        return [self.max_gross(b, verify=verify) for b in budgets]
+
+
+def max_gross_for_roster(
+    roster: EmployeeRoster,
+    budgets: Sequence[float],
+    year: int,
+    holidays: List[Holiday],
+    verify: bool = True,
+) -> List[float]:
+    """
+    One budget per roster row; the roster's gross_monthly column is ignored.
+    The per-day calendar is built once and shared by every row.
+    """
+    if len(budgets) != len(roster):
+        raise ValueError(f"Expected {len(roster)} budgets (one per roster row), got {len(budgets)}")
+
+    days = DayCounts(date(year, 1, 1), date(year, 12, 31), holidays)
+    results: List[float] = []
+    for i, budget in enumerate(budgets):
+        solver = GrossSolver(
+            start_date=date.fromordinal(roster.start_ordinal[i]),
+            end_date=date.fromordinal(roster.end_ordinal[i]),
+            year=year,
+            holidays=holidays,
+            annual_leave_days=roster.annual_leave_days[i],
+            employer_insurance=roster.insurance_profiles[roster.insurance_index[i]],
+            days=days,
+        )
+        results.append(solver.max_gross(budget, verify=verify))
+    return results
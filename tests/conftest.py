@@ -0,0 +1,22 @@
+from datetime import date
+
+import pytest
+
+from hr_cost.models import Holiday
+
+
+@pytest.fixture
+def holidays():
+    """
+    Ngày lễ mẫu 2026–2027.
+    4/1/2026 là Chủ nhật -> không được tính là ngày lễ hưởng lương.
+    """
+    return [
+        Holiday(date=date(2026, 1, 1), name="Tết Dương lịch"),
+        Holiday(date=date(2026, 1, 4), name="Test Sunday"),
+        Holiday(date=date(2026, 4, 30), name="Ngày Chiến thắng"),
+        Holiday(date=date(2026, 5, 1), name="Quốc tế Lao động"),
+        Holiday(date=date(2026, 9, 2), name="Quốc khánh"),
+        Holiday(date=date(2027, 1, 1), name="Tết Dương lịch"),
+        Holiday(date=date(2027, 4, 30), name="Ngày Chiến thắng"),
+    ]
@@ -1,6 +1,7 @@
 from datetime import date
 
 from hr_cost.calendar import (
+    DayCounts,
     count_workdays_mon_sat,
     count_paid_holidays,
 )
@@ -62,4 +63,25 @@ def test_holiday_on_weekday_counted():
 
     holidays_count = count_paid_holidays(start, end, holidays)
 
-    assert holidays_count == 1
\ No newline at end of file
+    assert holidays_count == 1
+
+
+def test_day_counts_match_loop_counts():
+    """
+    DayCounts (prefix sums) phải khớp với cách đếm từng ngày.
+    """
+    holidays = [
+        Holiday(date=date(2026, 1, 4), name="Test Sunday"),
+        Holiday(date=date(2026, 1, 5), name="Test Monday"),
+        Holiday(date=date(2026, 9, 2), name="Quoc khanh"),
+    ]
+    counts = DayCounts(date(2026, 1, 1), date(2026, 12, 31), holidays)
+
+    for start, end in [
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 1, 4), date(2026, 1, 5)),
+        (date(2026, 8, 15), date(2026, 12, 31)),
+    ]:
+        s, e = start.toordinal(), end.toordinal()
+        assert counts.count_workdays(s, e) == count_workdays_mon_sat(start, end, holidays)
+        assert counts.count_paid_holidays(s, e) == count_paid_holidays(start, end, holidays)
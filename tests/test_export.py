@@ -0,0 +1,92 @@
+import io
+import zipfile
+from datetime import date
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from hr_cost.export import build_employee_workbook, export_roster_zip, workbook_names
+from hr_cost.models import EmployeeRoster, Inputs
+from hr_cost.snapshot import write_snapshot
+
+
+@pytest.fixture
+def roster():
+    # "NV01_3" collides with the suffix given to the second "NV01"
+    rows = [
+        Inputs(gross_monthly=20_000_000, start_date=date(2026, 4, 15), end_date=date(2026, 12, 31)),
+        Inputs(gross_monthly=12_000_000, start_date=date(2026, 1, 1), end_date=date(2026, 6, 30)),
+        Inputs(gross_monthly=9_000_000, start_date=date(2026, 3, 1), end_date=date(2026, 3, 31)),
+        Inputs(gross_monthly=15_000_000, start_date=date(2026, 2, 10), end_date=date(2026, 11, 5)),
+        Inputs(gross_monthly=7_000_000, start_date=date(2026, 5, 1), end_date=date(2026, 5, 31)),
+    ]
+    return EmployeeRoster.from_inputs(rows, employee_ids=["NV01_3", "NV01", "NV/02", "NV01", "Nguyễn Văn A"])
+
+
+def test_workbook_layout(roster, holidays):
+    data = build_employee_workbook(roster.inputs(0), holidays, 2026, "NV01_3")
+    wb = openpyxl.load_workbook(io.BytesIO(data))
+
+    assert wb.sheetnames == ["RESULT", "HOLIDAYS"]
+    values = [row[0] for row in wb["RESULT"].iter_rows(values_only=True)]
+    assert values[0] == "INPUTS"
+    assert "MONTHLY_COST" in values
+    assert values[-12:] == [f"{m:02d}" for m in range(1, 13)]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_export_zip_one_workbook_per_employee(roster, holidays, workers):
+    progress = []
+    buf = io.BytesIO()
+
+    count = export_roster_zip(
+        roster, holidays, 2026, buf, max_workers=workers,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    with zipfile.ZipFile(buf) as zf:
+        names = zf.namelist()
+    assert count == 5
+    assert len(set(names)) == 5
+    assert sorted(names) == [
+        "NV01_2026.xlsx",
+        "NV01_3_2026.xlsx",
+        "NV01_4_2026.xlsx",
+        "NV_02_2026.xlsx",
+        "Nguyễn_Văn_A_2026.xlsx",
+    ]
+    assert progress[-1] == (5, 5)
+    assert len(progress) == 5
+
+
+def _result_rows(data):
+    wb = openpyxl.load_workbook(io.BytesIO(data))
+    return list(wb["RESULT"].iter_rows(values_only=True))
+
+
+def test_export_from_snapshot(roster, holidays, tmp_path):
+    """
+    Worker đọc dữ liệu từ snapshot (chỉ nhận số thứ tự dòng):
+    mỗi file trong ZIP phải giống workbook tính trực tiếp từ roster.
+    """
+    path = tmp_path / "roster.hrcs"
+    write_snapshot(str(path), roster, holidays)
+    buf = io.BytesIO()
+
+    count = export_roster_zip(roster, holidays, 2026, buf, max_workers=2, snapshot_path=str(path))
+
+    assert count == len(roster)
+    with zipfile.ZipFile(buf) as zf:
+        for i, name in enumerate(workbook_names(roster, 2026)):
+            expected = build_employee_workbook(roster.inputs(i), holidays, 2026, roster.employee_ids[i])
+            assert _result_rows(zf.read(name)) == _result_rows(expected)
+
+
+def test_export_rejects_roster_not_matching_snapshot(roster, holidays, tmp_path):
+    path = tmp_path / "roster.hrcs"
+    write_snapshot(str(path), roster, holidays)
+    other = EmployeeRoster.from_inputs([roster.inputs(0)], employee_ids=["NV09"])
+
+    with pytest.raises(ValueError):
+        export_roster_zip(other, holidays, 2026, io.BytesIO(), max_workers=0, snapshot_path=str(path))
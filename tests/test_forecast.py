@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+
+from hr_cost.engine import CalculationEngine
+from hr_cost.forecast import HeadcountForecast, forecast_headcount_plan
+from hr_cost.models import EmployerInsurance, Inputs, PlannedPosition
+
+
+@pytest.fixture
+def plan():
+    """
+    Kế hoạch nhân sự mẫu: nhiều người cùng hồ sơ, vào/nghỉ giữa tháng,
+    bắt đầu trước kỳ dự báo và một vị trí nằm ngoài kỳ.
+    """
+    return [
+        PlannedPosition("Dev", "B2", 30_000_000, date(2026, 1, 1), date(2027, 12, 31), count=5),
+        PlannedPosition("Dev", "B2", 30_000_000, date(2026, 3, 16), date(2027, 6, 30), count=3),
+        PlannedPosition("QA", "B1", 15_000_000, date(2026, 8, 5), date(2026, 8, 20), annual_leave_days=14),
+        PlannedPosition(
+            "Ops", "B1", 4_000_000, date(2025, 6, 1), date(2026, 11, 11),
+            employer_insurance=EmployerInsurance(enabled=True, rate=0.2, cap=0), count=2,
+        ),
+        PlannedPosition("Dev", "B3", 50_000_000, date(2028, 1, 1), date(2028, 12, 31)),
+    ]
+
+
+def test_forecast_matches_per_person_engine(plan, holidays):
+    """
+    Tổng theo tháng (headcount, I, J, O, P, Q) khớp với việc chạy
+    CalculationEngine cho từng người rồi cộng lại, trong 24 tháng.
+    """
+    rows = forecast_headcount_plan(plan, holidays, date(2026, 1, 1), date(2027, 12, 31))
+
+    assert len(rows) == 24
+    for row in rows:
+        expected = dict.fromkeys(("I", "J", "O", "P", "Q"), 0.0)
+        headcount = 0
+        for pos in plan:
+            inputs = Inputs(
+                gross_monthly=pos.gross_monthly,
+                start_date=pos.start_date,
+                end_date=pos.end_date,
+                annual_leave_days=pos.annual_leave_days,
+                employer_insurance=pos.employer_insurance,
+            )
+            month = CalculationEngine(inputs, holidays).calculate_month(row["year"], row["month"])
+            for key in expected:
+                expected[key] += month[key] * pos.count
+            if month["calc_start"] <= month["calc_end"]:
+                headcount += pos.count
+
+        assert row["headcount"] == headcount
+        for key, value in expected.items():
+            assert row[key] == pytest.approx(value)
+
+
+def test_forecast_reused_across_scenarios(plan, holidays):
+    """
+    Một HeadcountForecast dùng cho nhiều kịch bản:
+    nhân đôi kế hoạch -> headcount và chi phí gấp đôi.
+    """
+    forecast = HeadcountForecast(holidays, date(2026, 1, 1), date(2026, 12, 31))
+
+    base = forecast.run(plan)
+    doubled = forecast.run([p for p in plan for _ in range(2)])
+
+    for a, b in zip(base, doubled):
+        assert b["headcount"] == 2 * a["headcount"]
+        assert b["Q"] == pytest.approx(2 * a["Q"])
+
+
+def test_forecast_rejects_reversed_range(holidays):
+    """
+    Ngày kết thúc trước ngày bắt đầu -> ValueError.
+    """
+    with pytest.raises(ValueError):
+        HeadcountForecast(holidays, date(2026, 12, 31), date(2026, 1, 1))
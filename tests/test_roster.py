@@ -0,0 +1,144 @@
+import io
+from datetime import date
+
+import pytest
+
+from hr_cost.engine import CalculationEngine, RosterCalculationEngine
+from hr_cost.models import EmployeeRoster, EmployerInsurance, Inputs
+
+
+@pytest.fixture
+def sample_inputs():
+    # mid-month start, leaves mid-year, 2-day stint, outside 2026; 3 insurance profiles
+    return [
+        Inputs(gross_monthly=20_000_000, start_date=date(2026, 4, 15), end_date=date(2026, 12, 31)),
+        Inputs(gross_monthly=3_000_000, start_date=date(2025, 6, 1), end_date=date(2026, 5, 1), annual_leave_days=14),
+        Inputs(
+            gross_monthly=45_000_000,
+            start_date=date(2026, 1, 2),
+            end_date=date(2026, 1, 3),
+            employer_insurance=EmployerInsurance(enabled=True, rate=0.2, cap=0),
+        ),
+        Inputs(
+            gross_monthly=10_000_000,
+            start_date=date(2027, 1, 1),
+            end_date=date(2027, 12, 31),
+            employer_insurance=EmployerInsurance(enabled=False),
+        ),
+    ]
+
+
+def test_roster_matches_engine_per_employee(sample_inputs, holidays):
+    """
+    RosterCalculationEngine phải cho kết quả giống hệt CalculationEngine
+    chạy riêng từng nhân viên (F, H và các cột I..Q).
+    """
+    engine = RosterCalculationEngine(EmployeeRoster.from_inputs(sample_inputs), holidays)
+
+    for month_row in engine.calculate_year(2026):
+        for i, inp in enumerate(sample_inputs):
+            expected = CalculationEngine(inp, holidays).calculate_month(2026, month_row["month"])
+            assert month_row["F"] == expected["F"]
+            assert month_row["H"] == expected["H"]
+            for key in ("paid_workdays", "paid_holidays", "I", "J", "K", "L", "M", "N", "O", "P", "Q"):
+                assert month_row[key][i] == expected[key]
+
+
+def test_insurance_profiles_are_interned(sample_inputs):
+    """
+    Cấu hình bảo hiểm trùng nhau chỉ lưu một lần (3 cấu hình cho 12 nhân viên).
+    """
+    rows = sample_inputs * 3
+    roster = EmployeeRoster.from_inputs(rows)
+
+    assert len(roster) == 12
+    assert len(roster.insurance_profiles) == 3
+    assert roster.inputs(4) == rows[4]
+
+
+def test_from_csv_columns():
+    """
+    Đọc CSV: ngày dạng DD/MM/YYYY hoặc YYYY-MM-DD,
+    cột thiếu (annual_leave_days) dùng giá trị mặc định.
+    """
+    text = (
+        "employee_id,gross_monthly,start_date,end_date,insurance_enabled\n"
+        "NV01,20000000,15/04/2026,31/12/2026,1\n"
+        "NV02,12000000,2026-01-01,2026-06-30,0\n"
+    )
+    roster = EmployeeRoster.from_csv(io.StringIO(text))
+
+    assert roster.employee_ids == ["NV01", "NV02"]
+    assert roster.inputs(0).start_date == date(2026, 4, 15)
+    assert roster.inputs(1).end_date == date(2026, 6, 30)
+    assert roster.inputs(1).annual_leave_days == 12.0
+    assert [p.enabled for p in roster.insurance_profiles] == [True, False]
+
+
+def test_blank_optional_cells_use_defaults():
+    """
+    Ô trống (CSV) / NaN (pandas) ở cột tùy chọn -> dùng giá trị mặc định,
+    ô trống ở cột bắt buộc -> ValueError.
+    """
+    text = (
+        "employee_id,gross_monthly,start_date,end_date,annual_leave_days,insurance_enabled,insurance_cap\n"
+        "NV01,20000000,15/04/2026,31/12/2026,,,\n"
+        ",12000000,2026-01-01,2026-06-30,14,0,0\n"
+    )
+    roster = EmployeeRoster.from_csv(io.StringIO(text))
+
+    assert roster.employee_ids == ["NV01", "2"]
+    assert roster.inputs(0).annual_leave_days == 12.0
+    assert roster.inputs(0).employer_insurance == EmployerInsurance()
+    assert roster.inputs(1).employer_insurance == EmployerInsurance(enabled=False, cap=0)
+
+    nan = float("nan")
+    columns = {
+        "gross_monthly": [20_000_000],
+        "start_date": [date(2026, 1, 1)],
+        "end_date": [date(2026, 12, 31)],
+        "annual_leave_days": [nan],
+        "insurance_enabled": [nan],
+        "insurance_cap": [nan],
+    }
+    assert EmployeeRoster.from_columns(columns).inputs(0) == Inputs(
+        gross_monthly=20_000_000, start_date=date(2026, 1, 1), end_date=date(2026, 12, 31)
+    )
+
+    with pytest.raises(ValueError):
+        EmployeeRoster.from_columns({**columns, "gross_monthly": [nan]})
+
+
+def test_from_csv_short_and_long_rows():
+    """
+    Dòng thiếu cột cuối -> coi là ô trống (chỉ dòng đó dùng mặc định),
+    dòng thừa cột -> ValueError.
+    """
+    text = (
+        "employee_id,gross_monthly,start_date,end_date,annual_leave_days\n"
+        "A,20000000,01/01/2026,31/12/2026,20\n"
+        "B,12000000,01/01/2026,31/12/2026\n"
+    )
+    roster = EmployeeRoster.from_csv(io.StringIO(text))
+
+    assert [roster.inputs(i).annual_leave_days for i in range(2)] == [20.0, 12.0]
+
+    with pytest.raises(ValueError):
+        EmployeeRoster.from_csv(io.StringIO(text + "C,1,01/01/2026,31/12/2026,12,extra\n"))
+
+    with pytest.raises(ValueError, match="end_date"):
+        EmployeeRoster.from_csv(io.StringIO(text + "C,1,01/01/2026\n"))
+
+
+def test_numeric_ids_keep_integer_form():
+    """
+    Cột mã NV dạng số có ô trống (pandas đọc thành float) -> "1", không phải "1.0".
+    """
+    columns = {
+        "employee_id": [1.0, float("nan"), 1002.0],
+        "gross_monthly": [1, 2, 3],
+        "start_date": ["2026-01-01"] * 3,
+        "end_date": ["2026-12-31"] * 3,
+    }
+
+    assert EmployeeRoster.from_columns(columns).employee_ids == ["1", "2", "1002"]
@@ -0,0 +1,42 @@
+from datetime import date
+
+import pytest
+
+from hr_cost.engine import CalculationEngine
+from hr_cost.models import Inputs
+from hr_cost.sensitivity import DateSensitivity
+
+
+def test_start_date_curve_matches_engine(holidays):
+    # End date fixed at 20/10/2026, every 11th start date checked
+    end = date(2026, 10, 20)
+    rows = DateSensitivity(20_000_000, 2026, holidays).by_start_date(end_date=end, monthly=True)
+
+    assert len(rows) == 365
+    for row in rows[::11] + rows[-3:]:
+        inputs = Inputs(gross_monthly=20_000_000, start_date=row["date"], end_date=end)
+        expected = [r["Q"] for r in CalculationEngine(inputs, holidays).calculate_year(2026)]
+        assert row["monthly_Q"] == pytest.approx(expected)
+        assert row["Q"] == pytest.approx(sum(expected))
+
+
+def test_end_date_curve_matches_engine(holidays):
+    # Start date fixed at 10/03/2026
+    start = date(2026, 3, 10)
+    rows = DateSensitivity(20_000_000, 2026, holidays).by_end_date(start_date=start, monthly=True)
+
+    for row in rows[::13]:
+        inputs = Inputs(gross_monthly=20_000_000, start_date=start, end_date=row["date"])
+        expected = [r["Q"] for r in CalculationEngine(inputs, holidays).calculate_year(2026)]
+        assert row["monthly_Q"] == pytest.approx(expected)
+        assert row["Q"] == pytest.approx(sum(expected))
+
+
+def test_start_date_curve_is_non_increasing(holidays):
+    """
+    Bắt đầu càng muộn -> chi phí năm không tăng.
+    """
+    costs = [row["Q"] for row in DateSensitivity(20_000_000, 2026, holidays).by_start_date()]
+
+    assert all(a >= b - 1e-6 for a, b in zip(costs, costs[1:]))
+    assert costs[-1] >= 0
@@ -0,0 +1,86 @@
+from datetime import date
+
+import pytest
+
+from hr_cost.engine import RosterCalculationEngine
+from hr_cost.models import EmployeeRoster, EmployerInsurance, Inputs
+from hr_cost.snapshot import StaleSnapshotError, load_or_build, load_snapshot, write_snapshot
+
+
+@pytest.fixture
+def roster_csv(tmp_path):
+    path = tmp_path / "roster.csv"
+    path.write_text("employee_id,gross_monthly,start_date,end_date\nA,1000,01/01/2026,31/12/2026\n")
+    return path
+
+
+def test_snapshot_round_trip(holidays, tmp_path):
+    """
+    Ghi rồi đọc lại snapshot (mmap): mã NV, ngày lễ, dữ liệu từng dòng
+    và kết quả tính chi phí không đổi.
+    """
+    roster = EmployeeRoster.from_inputs(
+        [
+            Inputs(gross_monthly=20_000_000, start_date=date(2026, 4, 15), end_date=date(2026, 12, 31)),
+            Inputs(
+                gross_monthly=7_500_000,
+                start_date=date(2025, 1, 1),
+                end_date=date(2026, 6, 30),
+                annual_leave_days=14,
+                employer_insurance=EmployerInsurance(enabled=False, rate=0.2, cap=0),
+            ),
+        ],
+        employee_ids=["NV01", "Nguyễn Văn A"],
+    )
+    path = tmp_path / "roster.hrcs"
+    write_snapshot(str(path), roster, holidays)
+
+    snap = load_snapshot(str(path))
+
+    assert list(snap.roster.employee_ids) == list(roster.employee_ids)
+    assert snap.holidays == holidays
+    assert [snap.roster.inputs(i) for i in range(len(roster))] == [roster.inputs(i) for i in range(len(roster))]
+
+    expected = RosterCalculationEngine(roster, holidays).yearly_totals(2026)
+    assert RosterCalculationEngine(snap.roster, snap.holidays).yearly_totals(2026) == expected
+
+
+def test_stale_snapshot_detected(roster_csv, tmp_path):
+    """
+    File CSV nguồn thay đổi -> StaleSnapshotError; load_or_build tự tạo lại snapshot.
+    """
+    path = tmp_path / "roster.hrcs"
+
+    first = load_or_build(str(path), str(roster_csv))
+    assert load_snapshot(str(path), sources=[str(roster_csv)]).fingerprint == first.fingerprint
+
+    roster_csv.write_text("employee_id,gross_monthly,start_date,end_date\nA,2000,01/01/2026,31/12/2026\n")
+    with pytest.raises(StaleSnapshotError):
+        load_snapshot(str(path), sources=[str(roster_csv)])
+
+    rebuilt = load_or_build(str(path), str(roster_csv))
+    assert rebuilt.roster.gross_monthly[0] == 2000.0
+
+
+def test_truncated_snapshot_is_rebuilt(roster_csv, tmp_path):
+    """
+    Snapshot bị cắt cụt -> ValueError khi đọc; load_or_build ghi lại
+    (qua file tạm, không để lại file rác).
+    """
+    path = tmp_path / "roster.hrcs"
+    load_or_build(str(path), str(roster_csv))
+
+    path.write_bytes(path.read_bytes()[:100])
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
+
+    assert load_or_build(str(path), str(roster_csv)).roster.gross_monthly[0] == 1000.0
+    assert not any(p.name.startswith(".hrcs-") for p in tmp_path.iterdir())
+
+
+def test_not_a_snapshot(roster_csv):
+    """
+    File không phải snapshot -> ValueError.
+    """
+    with pytest.raises(ValueError):
+        load_snapshot(str(roster_csv))
@@ -0,0 +1,69 @@
+import math
+from datetime import date
+
+import pytest
+
+from hr_cost.engine import CalculationEngine
+from hr_cost.models import EmployeeRoster, EmployerInsurance, Inputs
+from hr_cost.solver import GrossSolver, max_gross_for_roster
+
+START = date(2026, 4, 15)
+END = date(2026, 12, 20)
+
+
+def _yearly_q(inputs, holidays):
+    return sum(row["Q"] for row in CalculationEngine(inputs, holidays).calculate_year(2026))
+
+
+@pytest.mark.parametrize("insurance", [
+    EmployerInsurance(),
+    EmployerInsurance(enabled=True, rate=0.2, cap=0),
+    EmployerInsurance(enabled=False),
+])
+def test_inverse_matches_forward(insurance, holidays):
+    # Budgets below and above the insurance cap breakpoints
+    solver = GrossSolver(START, END, 2026, holidays, employer_insurance=insurance)
+
+    budgets = [0.0, 1_000_000.0, 30_000_000.0, 150_000_000.0, 600_000_000.0]
+    for budget, gross in zip(budgets, solver.max_gross_many(budgets)):
+        inputs = Inputs(gross_monthly=gross, start_date=START, end_date=END, employer_insurance=insurance)
+        forward = _yearly_q(inputs, holidays)
+        assert forward <= budget
+        assert forward == pytest.approx(budget, rel=1e-9, abs=1e-6)
+        assert solver.yearly_cost(gross) == pytest.approx(forward)
+
+
+def test_roster_budgets_and_inactive_employee(holidays):
+    """
+    Một ngân sách cho mỗi dòng roster; nhân viên không làm trong năm -> vô hạn.
+    """
+    active = Inputs(
+        gross_monthly=0, start_date=START, end_date=END, annual_leave_days=14,
+        employer_insurance=EmployerInsurance(enabled=True, rate=0.2, cap=0),
+    )
+    inactive = Inputs(gross_monthly=0, start_date=date(2027, 1, 1), end_date=date(2027, 12, 31))
+    roster = EmployeeRoster.from_inputs([active, inactive])
+
+    gross = max_gross_for_roster(roster, [200_000_000, 200_000_000], 2026, holidays)
+
+    solved = Inputs(
+        gross_monthly=gross[0], start_date=START, end_date=END, annual_leave_days=14,
+        employer_insurance=active.employer_insurance,
+    )
+    assert _yearly_q(solved, holidays) <= 200_000_000
+    assert math.isinf(gross[1])
+
+
+def test_roster_budget_count_must_match(holidays):
+    roster = EmployeeRoster.from_inputs([Inputs(gross_monthly=0, start_date=START, end_date=END)])
+    with pytest.raises(ValueError):
+        max_gross_for_roster(roster, [1e8, 1e8], 2026, holidays)
+
+
+def test_negative_budget_rejected(holidays):
+    """
+    Ngân sách âm -> ValueError.
+    """
+    solver = GrossSolver(START, END, 2026, holidays)
+    with pytest.raises(ValueError):
+        solver.max_gross(-1)